@@ -12,19 +12,66 @@ except ImportError:
 
     USE_PATHLIB = False
 
+try:
+    import orjson  # type: ignore
+
+    USE_ORJSON = True
+except ImportError:
+
+    USE_ORJSON = False
+
+try:
+    import msgspec.json  # type: ignore
+
+    USE_MSGSPEC = True
+except ImportError:
+
+    USE_MSGSPEC = False
+
+try:
+    import xxhash  # type: ignore
+
+    USE_XXHASH = True
+except ImportError:
+
+    USE_XXHASH = False
+
+try:
+    import numba  # type: ignore
+
+    USE_NUMBA = True
+except ImportError:
+
+    USE_NUMBA = False
+
+try:
+    import pyvips  # type: ignore
+
+    USE_PYVIPS = True
+except (ImportError, OSError):  # OSError: pyvips installed without libvips
+
+    USE_PYVIPS = False
+
 import atexit
+import concurrent.futures
 import hashlib
+import itertools
 import json
 import locale
+import math
 import random
+import stat
 import string
 import subprocess
+from collections import OrderedDict
 
 import folder_paths  # type: ignore
 import ftfy  # type: ignore
+import numpy as np  # type: ignore
+import PIL.Image  # type: ignore
 import psutil  # type: ignore
 import torch  # type: ignore
-import torchvision.transforms as T  # type: ignore
+import torch.nn.functional as F  # type: ignore
 from PyQt6 import QtCore, QtGui, QtWidgets  # type: ignore
 from PyQt6.QtWidgets import QApplication, QMainWindow  # type: ignore
 
@@ -43,9 +90,21 @@ UNICODE_CHR = {
     "pin": "\U0001f4cc",  # 📌 Push Pin
     "left_arrow": "\u276e",  # ❮ left arrow
     "right_arrow": "\u276f",  # ❯ right arrow
-    "nbs": "\x0a",  # non-breaking space
+    "nbs": "\u00a0",  # non-breaking space
 }
 
+# Icons are constant, so run them through ftfy once at import
+ICONS = {key: ftfy.fix_text(value) for key, value in UNICODE_CHR.items()}
+
+# Context menu labels are constant too, so build them once
+MENU_SPACE = ICONS["nbs"] * 2
+MENU_ALWAYS_ON_TOP_TEXT = f"{ICONS['pin']}{MENU_SPACE}Always on Top{MENU_SPACE}(Ctrl+T)"
+MENU_COPY_TEXT = (
+    f"{ICONS['clipboard']}{MENU_SPACE}Copy to Clipboard{MENU_SPACE}(Ctrl+C)"
+)
+MENU_SAVE_TEXT = f"{ICONS['save']}{MENU_SPACE}Save Image{MENU_SPACE}(Ctrl+S)"
+MENU_CLOSE_TEXT = f"{ICONS['error']}{MENU_SPACE}Close Window{MENU_SPACE}(Esc)"
+
 
 def log_message(message, level="info"):
     """Print messages with color coding and proper Unicode handling."""
@@ -60,7 +119,7 @@ def log_message(message, level="info"):
 
     level_key = level.lower()
 
-    icon = ftfy.fix_text(UNICODE_CHR.get(level_key, ""))
+    icon = ICONS.get(level_key, "")
     safe_message = f"{colors.get(level_key, colors['reset'])}[{icon} {level.upper()}]: {ftfy.fix_text(message)}{colors['reset']}"
 
     try:
@@ -76,10 +135,15 @@ def log_message(message, level="info"):
 
 
 def safe_path(*args):
-    """Create a cross-platform path as a string, using pathlib if available."""
+    """Create a cross-platform path as a string by joining parts, without touching the filesystem."""
+    return os.path.normpath(os.path.join(*map(str, args)))
+
+
+def safe_path_resolved(*args):
+    """Create a canonical absolute path as a string, using pathlib if available."""
     if USE_PATHLIB:
         return str(Path(*map(str, args)).resolve())
-    return os.path.normpath(os.path.join(*args))
+    return os.path.realpath(os.path.join(*map(str, args)))
 
 
 def ensure_directory_exists(path):
@@ -91,21 +155,19 @@ def ensure_directory_exists(path):
 
 
 def safe_remove(file_path):
-    """Safely remove a file using pathlib if available, otherwise use os.remove()."""
-    if USE_PATHLIB:
-        path = Path(file_path)
-        if path.exists() and path.is_file():
-            path.unlink()
-    else:
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            os.remove(file_path)
+    """Safely remove a file, ignoring it if it does not exist."""
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
 
 
 def safe_exists(file_path):
-    """Check if a file exists using pathlib if available, otherwise use os.path.exists()."""
-    if USE_PATHLIB:
-        return Path(file_path).exists() and Path(file_path).is_file()
-    return os.path.exists(file_path) and os.path.isfile(file_path)
+    """Check if a regular file exists with a single os.stat() call."""
+    try:
+        return stat.S_ISREG(os.stat(file_path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
 
 
 def safe_is_dir(directory_path):
@@ -115,21 +177,48 @@ def safe_is_dir(directory_path):
     return os.path.isdir(directory_path)
 
 
+SMALL_FILE_CHUNK_SIZE = 64 << 10  # Our JSON files fit in a single read
+
+
 def safe_read_file(file_path, default_data=""):
     """Safely read a file's contents, returning default_data if the file does not exist."""
-    if not safe_exists(file_path):
-        return default_data
-
     try:
         if USE_PATHLIB:
             return Path(file_path).read_text(encoding="utf-8")
         with open(file_path, "r", encoding="utf-8") as f:
             return f.read()
+    except FileNotFoundError:
+        return default_data
     except Exception as e:
         log_message(f"Error reading {file_path}: {e}", "warning")
         return default_data
 
 
+def safe_read_small_file(file_path, default_data=""):
+    """Read a small UTF-8 file through a raw fd, returning default_data if the file does not exist."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        return default_data
+    except Exception as e:
+        log_message(f"Error reading {file_path}: {e}", "warning")
+        return default_data
+
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, SMALL_FILE_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8")
+    except Exception as e:
+        log_message(f"Error reading {file_path}: {e}", "warning")
+        return default_data
+    finally:
+        os.close(fd)
+
+
 def safe_write_file(file_path, content):
     """Safely write content to a file using pathlib if available, otherwise use open()."""
     try:
@@ -142,6 +231,55 @@ def safe_write_file(file_path, content):
         log_message(f"Error writing to {file_path}: {e}", "error")
 
 
+def safe_write_bytes(file_path, data):
+    """Safely write bytes to a file through a raw fd, skipping the buffered IO stack. Returns True on success."""
+    try:
+        fd = os.open(
+            file_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        return True
+    except Exception as e:
+        log_message(f"Error writing to {file_path}: {e}", "error")
+        return False
+
+
+def encode_json(data):
+    """Serialize data to compact UTF-8 JSON bytes, using msgspec or orjson if available."""
+    if USE_MSGSPEC:
+        return msgspec.json.encode(data)
+    if USE_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(data):
+    """Parse JSON text, using msgspec or orjson if available.
+
+    Decoding errors are always raised as json.JSONDecodeError so callers only handle one type.
+    """
+    if USE_MSGSPEC:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), data, 0) from e
+    if USE_ORJSON:
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json's
+    return json.loads(data)
+
+
+def settings_digest(payload):
+    """Return a short digest of serialized settings, used to skip redundant writes."""
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
 def safe_append_file(file_path, content):
     """Safely append content to a file, creating it if it does not exist."""
     try:
@@ -167,33 +305,88 @@ def safe_rename(old_path, new_path):
             log_message(f"Error renaming {old_path} to {new_path}: {e}", "error")
 
 
-def safe_list_dir(directory_path):
-    """Safely list the contents of a directory, returning an empty list if the directory does not exist."""
-    if not safe_is_dir(directory_path):
-        return []
-    return (
-        os.listdir(directory_path)
-        if not USE_PATHLIB
-        else [str(p) for p in Path(directory_path).iterdir()]
-    )
-
-
 def get_comfyui_temp_folder():
-    """Get ComfyUI's temp folder path using safe_path() and ensure_directory_exists()."""
-    comfy_temp_dir = safe_path(folder_paths.get_temp_directory())  # Base temp directory
+    """Get ComfyUI's temp folder path using safe_path_resolved() and ensure_directory_exists()."""
+    comfy_temp_dir = safe_path_resolved(
+        folder_paths.get_temp_directory()
+    )  # Base temp directory, canonicalized once
     ensure_directory_exists(comfy_temp_dir)
     return comfy_temp_dir
 
 
+def get_ram_temp_folder(comfy_temp_dir):
+    """Get a private RAM-backed (tmpfs) folder for preview images if /dev/shm is usable, else None."""
+    shm_dir = "/dev/shm"
+    if not hasattr(os, "getuid") or not (
+        safe_is_dir(shm_dir) and os.access(shm_dir, os.W_OK)
+    ):
+        return None
+
+    # One folder per user and ComfyUI install, so separate instances do not share previews
+    install_key = f"{os.getuid()}:{comfy_temp_dir}".encode("utf-8")
+    install_id = hashlib.sha256(install_key).hexdigest()[:12]
+    ram_temp_dir = safe_path(shm_dir, f"comfyui_float_preview_{install_id}")
+    try:
+        os.mkdir(ram_temp_dir, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+
+    # /dev/shm is shared by all users, so only trust a real directory (not a
+    # symlink) that we own and that nobody else can write to
+    try:
+        dir_stat = os.lstat(ram_temp_dir)
+    except OSError:
+        return None
+    if (
+        not stat.S_ISDIR(dir_stat.st_mode)
+        or dir_stat.st_uid != os.getuid()
+        or dir_stat.st_mode & 0o077
+    ):
+        log_message(
+            f"Not using {ram_temp_dir}: it is not a private folder owned by this user",
+            "warning",
+        )
+        return None
+    return ram_temp_dir
+
+
 def get_float_preview_temp_folder():
     """Get the Float Preview temp folder inside ComfyUI's temp directory."""
-    float_preview_temp_dir = safe_path(
-        get_comfyui_temp_folder(), "float_preview"
-    )  # Uses base temp dir
+    comfy_temp_dir = get_comfyui_temp_folder()  # Uses base temp dir
+    float_preview_temp_dir = safe_path(comfy_temp_dir, "float_preview")
     ensure_directory_exists(float_preview_temp_dir)
     return float_preview_temp_dir
 
 
+def has_free_space(directory, needed_bytes):
+    """Check if the filesystem holding directory has at least needed_bytes available."""
+    try:
+        fs_stat = os.statvfs(directory)
+    except (AttributeError, OSError):
+        return False
+    return fs_stat.f_bavail * fs_stat.f_frsize >= needed_bytes
+
+
+def cleanup_preview_images(*directories):
+    """Delete leftover preview images from the given folders."""
+    for directory in directories:
+        try:
+            # scandir entries carry name and full path, no extra stat per file
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("temp_float_preview_"):
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log_message(f"Cleanup failed: {e}", "error")
+
+
 def get_mohseni_kit_dir():
     """Get Mohseni Kit custom node folder path inside ComfyUI."""
     mohseni_custom_nodes_dir = safe_path(
@@ -204,15 +397,8 @@ def get_mohseni_kit_dir():
 
 
 def get_script_path():
-    """Return the absolute path of the current script using safe_path()."""
-    return safe_path(__file__)
-
-
-def safe_get_name(file_path):
-    """Return the name of the current script file using pathlib if available, otherwise fallback to os.path."""
-    if USE_PATHLIB:
-        return Path(file_path).name
-    return os.path.basename(file_path)
+    """Return the absolute path of the current script using safe_path_resolved()."""
+    return safe_path_resolved(__file__)
 
 
 def get_window_icon():
@@ -222,22 +408,34 @@ def get_window_icon():
 
 def calculate_image_hash(image_path):
     """Generate a quick hash for the first image file."""
-    if not safe_exists(image_path):
-        return None
-
     try:
-        with open(image_path, "rb") as f:
-            return hashlib.sha256(f.read(1024)).hexdigest()
+        # Raw fd read: skips the BufferedReader setup for a 1 KiB header
+        fd = os.open(image_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            header = os.read(fd, 1024)
+        finally:
+            os.close(fd)
+        return hashlib.sha256(header).hexdigest()
+    except FileNotFoundError:
+        return None
     except Exception as e:
         log_message(f"Error reading {image_path}: {e}", "warning")
         return None
 
 
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB slices keep the hash input cache-resident
+
+
 def generate_image_hash(image):
-    """Generate a SHA256 hash for an image tensor."""
+    """Generate a hash for an image tensor of any layout, using XXH3-128 if xxhash is available, otherwise SHA256."""
     try:
-        image_bytes = image.cpu().numpy().tobytes()
-        return hashlib.sha256(image_bytes).hexdigest()
+        tensor = image.detach().cpu().contiguous()
+        image_view = memoryview(tensor.numpy()).cast("B")  # Zero-copy byte view
+        # Only used for change detection, so a fast non-cryptographic hash is enough
+        hasher = xxhash.xxh3_128() if USE_XXHASH else hashlib.sha256()
+        for start in range(0, len(image_view), HASH_CHUNK_SIZE):
+            hasher.update(image_view[start : start + HASH_CHUNK_SIZE])
+        return hasher.hexdigest()
     except Exception:
         return None
 
@@ -253,11 +451,143 @@ def generate_random_string(length=6):
     return "".join(_sysrand.choices(CHARACTERS, k=length))
 
 
+def downscale_to_max_side(images, max_side):
+    """Downscale a (B, C, H, W) tensor so its longest side is at most max_side."""
+    height, width = images.shape[-2:]
+    longest = max(height, width)
+    if longest <= max_side:
+        return images
+
+    scale = max_side / longest
+    return F.interpolate(
+        images,
+        size=(max(1, round(height * scale)), max(1, round(width * scale))),
+        mode="bilinear",
+        antialias=True,
+        align_corners=False,
+    )
+
+
+if USE_NUMBA:
+
+    @numba.njit(parallel=True, cache=True)
+    def quantize_to_uint8(src, dst):
+        """Clamp 1-D float32 values to [0, 1], scale to 0-255 and round into the uint8 dst."""
+        for i in numba.prange(src.size):
+            value = src[i]
+            # Written so NaN fails the test and maps to 0 instead of an undefined cast
+            if not value > 0.0:
+                dst[i] = 0
+            elif value >= 1.0:
+                dst[i] = 255
+            else:
+                dst[i] = np.uint8(value * 255.0 + 0.5)
+
+
+def batch_to_uint8_array(batch):
+    """Quantize a (B, H, W, C) float batch in [0, 1] to a contiguous uint8 NumPy array on the host."""
+    if USE_NUMBA and batch.device.type == "cpu" and batch.dtype == torch.float32:
+        # One fused, SIMD-parallel pass instead of clamp/mul/round/cast dispatches
+        src = batch.detach().contiguous().numpy()
+        dst = np.empty(src.shape, dtype=np.uint8)
+        quantize_to_uint8(src.reshape(-1), dst.reshape(-1))
+        return dst
+
+    # Quantize on the batch's own device so only uint8 bytes cross to the host.
+    # clamp() makes the one working copy (the input tensor is shared with
+    # other nodes); the scaling and rounding then run in place on it
+    batch_u8 = batch.clamp(0, 1).mul_(255.0).round_().to(torch.uint8).contiguous()
+    return batch_u8.cpu().numpy()
+
+
+def save_preview_image(image_array, temp_path, preview_format="PNG"):
+    """Encode a contiguous uint8 (H, W, 3) image array to temp_path and return the path."""
+    height, width, bands = image_array.shape
+
+    if USE_PYVIPS:
+        vips_img = pyvips.Image.new_from_memory(
+            image_array.data, width, height, bands, "uchar"
+        )
+        vips_img.write_to_file(temp_path, **PYVIPS_SAVE_OPTIONS[preview_format])
+        return temp_path
+
+    # Wrap the array's buffer directly as raw RGB, without fromarray's introspection
+    pil_img = PIL.Image.frombuffer(
+        "RGB", (width, height), image_array, "raw", "RGB", 0, 1
+    )
+    pil_img.save(
+        temp_path, format=preview_format, **PREVIEW_SAVE_OPTIONS[preview_format]
+    )
+    return temp_path
+
+
+def save_preview_image_or_fallback(image_array, temp_path, preview_format="PNG"):
+    """Save a preview with save_preview_image(), retrying in FLOAT_PREVIEW_TEMP_DIR if its folder is full or unwritable."""
+    try:
+        return save_preview_image(image_array, temp_path, preview_format)
+    except PREVIEW_SAVE_ERRORS as e:
+        fallback_path = safe_path(FLOAT_PREVIEW_TEMP_DIR, os.path.basename(temp_path))
+        if fallback_path == temp_path:
+            raise
+        log_message(f"Failed to write {temp_path} ({e}), using disk instead", "warning")
+        try:
+            os.unlink(temp_path)  # Drop the partial file so it frees its space
+        except OSError:
+            pass
+        return save_preview_image(image_array, fallback_path, preview_format)
+
+
+def decode_scaled(path, width, height):
+    """Decode an image directly at the size that fits width x height, keeping its aspect ratio."""
+    reader = QtGui.QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        size.scale(width, height, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        reader.setScaledSize(size)  # Let the decoder emit the target size
+
+    image = reader.read()
+    if image.isNull():
+        return None
+    return QtGui.QPixmap.fromImage(image)
+
+
 # --- Globals ---
+# PNG encoding releases the GIL, so a small pool encodes batch frames in parallel
+IO_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="float_preview_io"
+)
 FLOAT_PREVIEW_TEMP_DIR = get_float_preview_temp_folder()
+# Preview images go to RAM when there is room for them; everything else stays on disk
+FLOAT_PREVIEW_RAM_DIR = get_ram_temp_folder(os.path.dirname(FLOAT_PREVIEW_TEMP_DIR))
 MOHSENI_KIT_DIR = get_mohseni_kit_dir()
 JSON_FILE_PATH = safe_path(FLOAT_PREVIEW_TEMP_DIR, "image_paths.json")
+# The window outlives ComfyUI restarts, which wipe the temp folder, so its PID lives here
+PID_FILE_PATH = safe_path(MOHSENI_KIT_DIR, "float_window.pid")
 SETTINGS_FILE_PATH = safe_path(MOHSENI_KIT_DIR, "float_preview_settings.json")
+SETTINGS_FLUSH_DELAY_MS = 2000  # Batch settings writes into one flush
+RESIZE_DEBOUNCE_MS = 50  # Smooth rescale once resizing settles
+WATCHER_REARM_MS = 1000  # Retry watching the temp dir after it was deleted
+
+# PNG keeps saved/copied previews lossless; JPEG is a faster, lossy node option
+PREVIEW_FORMATS = ["PNG", "JPEG"]
+PREVIEW_SAVE_OPTIONS = {
+    "JPEG": {"quality": 85, "subsampling": 2},
+    "PNG": {"optimize": False, "compress_level": 0},  # Stored, no deflate
+}
+PYVIPS_SAVE_OPTIONS = {
+    "JPEG": {"Q": 85, "subsample_mode": "on"},
+    "PNG": {"compression": 0, "filter": "none"},  # Skip per-row filter selection
+}
+PREVIEW_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png"}
+PREVIEW_SAVE_ERRORS = (OSError, pyvips.Error) if USE_PYVIPS else (OSError,)
+RAM_TEMP_HEADROOM = 64 << 20  # Free bytes left on tmpfs, e.g. Docker's 64 MiB /dev/shm
+PREVIEW_MAX_SIZE = 2048  # Longest side of an encoded preview
+EARLY_PREVIEW_FRAMES = 4  # Frames shown before the rest of a batch is encoded
+DEDUP_SAMPLE_SIZE = 1024  # Bytes compared per frame before a full duplicate check
+
+IS_CHANGED_SAMPLE_SIZE = 4096  # Values hashed per IS_CHANGED call
+# Unique IS_CHANGED values that force a re-execution, without touching the RNG
+_always_tick = itertools.count()
 
 
 # --- Float Window Implementation ---
@@ -266,13 +596,25 @@ class FloatWindow(QMainWindow):
 
     def __init__(self, temp_image_paths):
         super().__init__()
+
+        # Settings are marked dirty and flushed once by a single-shot timer
+        self._settings_dirty = False
+        self._settings_timer = QtCore.QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        atexit.register(self._flush_settings)
+
+        # Coalesce resize bursts into a single smooth rescale
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._do_rescale)
+
         self.temp_image_paths = temp_image_paths
         self.current_index = 0
-        self.pixmap_cache = {}
-        self.scaled_image_cache = {}
-        self.current_label_size = None
+        self.pixmap_cache = OrderedDict()
+        self.scaled_image_cache = OrderedDict()
+        self._display_source = (None, None)  # Last smoothly scaled (path, pixmap)
         self.max_cache_size = 50
-        safe_space = ftfy.fix_text(UNICODE_CHR.get("nsb", " ") * 2)
 
         self.setWindowTitle("Float Preview - Mohseni Kit")
 
@@ -314,102 +656,121 @@ class FloatWindow(QMainWindow):
         self.check_for_existing_images()
 
         self.context_menu = QtWidgets.QMenu(self)
-        self.always_on_top_action = self.context_menu.addAction(
-            f"{ftfy.fix_text(UNICODE_CHR.get('pin', ''))}{safe_space}Always on Top{safe_space}(Ctrl+T)"
-        )
+        self.always_on_top_action = self.context_menu.addAction(MENU_ALWAYS_ON_TOP_TEXT)
         self.always_on_top_action.setCheckable(True)
         self.always_on_top_action.setChecked(self.always_on_top)
         self.always_on_top_action.triggered.connect(self.toggle_always_on_top)
 
         self.context_menu.addSeparator()
 
-        self.copy_image_action = self.context_menu.addAction(
-            f"{ftfy.fix_text(UNICODE_CHR.get('clipboard', ''))}{safe_space}Copy to Clipboard{safe_space}(Ctrl+C)"
-        )
+        self.copy_image_action = self.context_menu.addAction(MENU_COPY_TEXT)
         self.copy_image_action.triggered.connect(self.copy_to_clipboard)
 
         self.context_menu.addSeparator()
 
-        self.save_image_action = self.context_menu.addAction(
-            f"{ftfy.fix_text(UNICODE_CHR.get('save', ''))}{safe_space}Save Image{safe_space}(Ctrl+S)"
-        )
+        self.save_image_action = self.context_menu.addAction(MENU_SAVE_TEXT)
         self.save_image_action.triggered.connect(self.save_image)
 
         self.context_menu.addSeparator()
 
-        self.exit_action = self.context_menu.addAction(
-            f"{ftfy.fix_text(UNICODE_CHR.get('error', ''))}{safe_space}Close Window{safe_space}(Esc)"
-        )
+        self.exit_action = self.context_menu.addAction(MENU_CLOSE_TEXT)
         self.exit_action.triggered.connect(self.close)
 
         self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.check_for_updates)
-        self.timer.start(200)
+        # Watch the image paths JSON instead of polling it; the temp dir is
+        # watched too so the file can be re-armed after it is deleted and recreated
+        self._json_data = None
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.addPath(FLOAT_PREVIEW_TEMP_DIR)
+        if safe_exists(JSON_FILE_PATH):
+            self._watcher.addPath(JSON_FILE_PATH)
+        self._watcher.fileChanged.connect(self.check_for_updates)
+        self._watcher.directoryChanged.connect(self.check_for_updates)
+
+        # A deleted directory drops out of the watcher, so retry until it is back
+        self._rearm_timer = QtCore.QTimer(self)
+        self._rearm_timer.setSingleShot(True)
+        self._rearm_timer.setInterval(WATCHER_REARM_MS)
+        self._rearm_timer.timeout.connect(self._rearm_watcher)
 
         self.update_image()
 
+        # The full batch may have been written before the watcher was armed
+        self.check_for_updates()
+
     def load_settings(self):
-        """Load the window's persistent settings using safe_read_file()."""
-        settings_data = safe_read_file(SETTINGS_FILE_PATH, default_data="{}")
+        """Load the window's persistent settings once using safe_read_small_file() and keep them in memory."""
+        settings_data = safe_read_small_file(SETTINGS_FILE_PATH, default_data="{}")
+        self._last_written_digest = settings_digest(settings_data.encode("utf-8"))
 
         try:
-            settings = json.loads(settings_data)  # Ensure settings is a dictionary
-            self.always_on_top = settings.get("always_on_top", False)
-            self.resize(settings.get("width", 600), settings.get("height", 600))
-            self.move(settings.get("x", 100), settings.get("y", 100))
+            settings = json.loads(settings_data)
+            # Ensure settings is a dictionary
+            self._settings = settings if isinstance(settings, dict) else {}
+            self.always_on_top = self._settings.get("always_on_top", False)
+            self.resize(
+                self._settings.get("width", 600), self._settings.get("height", 600)
+            )
+            self.move(self._settings.get("x", 100), self._settings.get("y", 100))
         except json.JSONDecodeError:
             log_message(
                 "Failed to load settings file. Using default settings.", "warning"
             )
+            self._settings = {}
             self.always_on_top = False
             self.resize(600, 600)
             self.move(100, 100)
 
     def save_settings(self):
-        """Save the window's settings persistently using safe_write_file()."""
+        """Mark the settings dirty and schedule a batched write."""
+        self._settings_dirty = True
+        self._settings_timer.start(SETTINGS_FLUSH_DELAY_MS)
+
+    def _flush_settings(self):
+        """Write pending settings once using safe_write_bytes(), unless they are unchanged on disk."""
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        self._settings_timer.stop()
+
         first_image_hash = (
             calculate_image_hash(self.temp_image_paths[0])
             if self.temp_image_paths
             else None
         )
 
-        settings = {
-            "always_on_top": self.always_on_top,
-            "x": self.x(),
-            "y": self.y(),
-            "width": self.width(),
-            "height": self.height(),
-            "first_image_hash": first_image_hash,
-        }
+        self._settings.update(
+            {
+                "always_on_top": self.always_on_top,
+                "x": self.x(),
+                "y": self.y(),
+                "width": self.width(),
+                "height": self.height(),
+                "first_image_hash": first_image_hash,
+            }
+        )
 
-        try:
-            safe_write_file(SETTINGS_FILE_PATH, json.dumps(settings, indent=2))
-        except Exception as e:
-            pass
+        payload = json.dumps(self._settings, indent=2).encode("utf-8")
+        digest = settings_digest(payload)
+        if digest == self._last_written_digest:
+            return  # Nothing changed since the last write
+
+        if safe_write_bytes(SETTINGS_FILE_PATH, payload):
+            self._last_written_digest = digest
 
     def check_for_existing_images(self):
         """Load previous images if they exist, match the stored hash, and no new images were created."""
-        stored_hash = None
         image_existence = True
 
-        # Load stored hash from settings
-        settings_data = safe_read_file(SETTINGS_FILE_PATH, default_data="{}")
-        try:
-            settings = json.loads(settings_data)
-            stored_hash = settings.get("first_image_hash")
-        except json.JSONDecodeError:
-            log_message(
-                "Failed to load settings.json. Continuing without hash check.",
-                "warning",
-            )
+        # Stored hash comes from the settings already parsed by load_settings()
+        stored_hash = self._settings.get("first_image_hash")
 
         # Load previous image paths
-        temp_image_paths_data = safe_read_file(JSON_FILE_PATH, default_data="[]")
+        temp_image_paths_data = safe_read_small_file(JSON_FILE_PATH, default_data="[]")
         try:
-            temp_image_paths = json.loads(temp_image_paths_data)
+            temp_image_paths = decode_json(temp_image_paths_data)
         except json.JSONDecodeError:
             log_message("Failed to parse image_paths.json. Resetting paths.", "warning")
             return
@@ -417,15 +778,8 @@ class FloatWindow(QMainWindow):
         # Ensure all image paths exist
         if temp_image_paths:
             for temp_image in temp_image_paths:
-                if not safe_exists(temp_image):
-                    image_existence = False
-                    break
-                try:
-                    pixmap = QtGui.QPixmap(temp_image)
-                    if pixmap.isNull():
-                        image_existence = False
-                        break
-                except Exception:
+                # Header-only check; also fails for missing files, so no separate stat
+                if not QtGui.QImageReader(temp_image).canRead():
                     image_existence = False
                     break
 
@@ -448,6 +802,7 @@ class FloatWindow(QMainWindow):
     def load_pixmap(self, path):
         """Load and cache the QPixmap for a given image path."""
         if path in self.pixmap_cache:
+            self.pixmap_cache.move_to_end(path)  # Mark as most recently used
             return self.pixmap_cache[path]
 
         pixmap = QtGui.QPixmap(path)
@@ -461,21 +816,49 @@ class FloatWindow(QMainWindow):
         self.pixmap_cache[path] = pixmap
         return pixmap
 
-    def check_for_updates(self):
-        """Check for new image paths and reload if necessary."""
-        # Ensure JSON file exists
-        if not safe_exists(JSON_FILE_PATH):
+    def _rearm_watcher(self):
+        """Watch the temp dir again once it has been recreated."""
+        if self.closing:
+            return
+        if not safe_is_dir(FLOAT_PREVIEW_TEMP_DIR):
+            self._rearm_timer.start()
             return
+        self._watcher.addPath(FLOAT_PREVIEW_TEMP_DIR)
+        if safe_exists(JSON_FILE_PATH):
+            self._watcher.addPath(JSON_FILE_PATH)
+        self.check_for_updates()
+
+    def check_for_updates(self, changed_path=None):
+        """Check for new image paths and reload if necessary."""
+        if FLOAT_PREVIEW_TEMP_DIR not in self._watcher.directories():
+            if not self._rearm_timer.isActive():
+                self._rearm_timer.start()
+
+        # Ensure JSON file exists and is watched (it is lost from the watcher when replaced)
+        if JSON_FILE_PATH not in self._watcher.files():
+            if not safe_exists(JSON_FILE_PATH):
+                return
+            self._watcher.addPath(JSON_FILE_PATH)
 
         # Load image paths safely
-        image_paths_data = safe_read_file(JSON_FILE_PATH, default_data="[]")
+        image_paths_data = safe_read_small_file(JSON_FILE_PATH, default_data="")
+        if not image_paths_data:
+            return  # Truncated mid-write; the watcher fires again once it is written
+
+        # Skip events that did not change the JSON file (e.g. new preview images).
+        # The file is tiny, so comparing its content is cheap and, unlike its
+        # mtime, does not depend on the filesystem's timestamp resolution
+        if image_paths_data == self._json_data:
+            return
 
         try:
-            new_image_paths = json.loads(image_paths_data)
+            new_image_paths = decode_json(image_paths_data)
         except json.JSONDecodeError:
             log_message("Invalid JSON content", "error")
             return
 
+        self._json_data = image_paths_data
+
         # Only update if paths have changed
         if new_image_paths != self.temp_image_paths:
             self.scaled_image_cache.clear()
@@ -484,36 +867,53 @@ class FloatWindow(QMainWindow):
             self.current_index = 0
             self.update_image()
 
-    def update_image(self):
-        """Load and display the current image, scaling it based on window size."""
+    def update_image(self, fast=False):
+        """Load and display the current image, scaling it based on window size.
+
+        With fast=True the last smooth frame is stretched with FastTransformation and
+        not cached, for intermediate frames while the window is being resized.
+        """
         if self.closing or not self.temp_image_paths:
             return
 
         self.current_index %= len(self.temp_image_paths)
 
         path = self.temp_image_paths[self.current_index]
-
-        if (
-            path in self.scaled_image_cache
-            and self.current_label_size == self.label.size()
-        ):
-            scaled_pixmap = self.scaled_image_cache[path]
-        else:
-            pixmap = QtGui.QPixmap(path)
-            if pixmap.isNull():
-                log_message(f"Failed to load image: {path}", "warning")
-                return
-
-            # Cache the newly scaled image
-            scaled_pixmap = pixmap.scaled(
+        cache_key = (path, self.width(), self.height())
+
+        if cache_key in self.scaled_image_cache:
+            self.scaled_image_cache.move_to_end(cache_key)
+            scaled_pixmap = self.scaled_image_cache[cache_key]
+            self._display_source = (path, scaled_pixmap)
+        elif fast and self._display_source[0] == path:
+            # Stretch the last smooth frame; the debounced rescale replaces it
+            scaled_pixmap = self._display_source[1].scaled(
                 self.width(),
                 self.height(),
                 QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+                QtCore.Qt.TransformationMode.FastTransformation,
             )
+        else:
+            if path in self.pixmap_cache:
+                # Full-size pixmap already decoded (copy/save), only rescale it
+                scaled_pixmap = self.load_pixmap(path).scaled(
+                    self.width(),
+                    self.height(),
+                    QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                    QtCore.Qt.TransformationMode.SmoothTransformation,
+                )
+            else:
+                scaled_pixmap = decode_scaled(path, self.width(), self.height())
+                if scaled_pixmap is None:
+                    log_message(f"Failed to load image: {path}", "warning")
+                    return
+
+            # Cache only the final, smoothly scaled image
+            if len(self.scaled_image_cache) >= self.max_cache_size:
+                self.scaled_image_cache.popitem(last=False)
 
-            self.scaled_image_cache[path] = scaled_pixmap
-            self.current_label_size = self.label.size()
+            self.scaled_image_cache[cache_key] = scaled_pixmap
+            self._display_source = (path, scaled_pixmap)
 
         self.label.setPixmap(scaled_pixmap)
         self.label.adjustSize()
@@ -522,7 +922,7 @@ class FloatWindow(QMainWindow):
         if len(self.temp_image_paths) > 1:
             self.indicator_label.show()
             self.indicator_label.setText(
-                f"{ftfy.fix_text(UNICODE_CHR.get('left_arrow', ''))}  {self.current_index + 1} / {len(self.temp_image_paths)}  {ftfy.fix_text(UNICODE_CHR.get('right_arrow', ''))}"
+                f"{ICONS['left_arrow']}  {self.current_index + 1} / {len(self.temp_image_paths)}  {ICONS['right_arrow']}"
             )
             self.update_indicator_position()
         else:
@@ -557,37 +957,24 @@ class FloatWindow(QMainWindow):
         self.show()  # Refresh window state
 
     def save_always_on_top_state(self):
-        """Save the 'Always on Top' state to the settings file using safe_read_file() and safe_write_file()."""
-        # Load existing settings safely
-        settings_data = safe_read_file(SETTINGS_FILE_PATH, default_data="{}")
-        try:
-            settings = json.loads(settings_data)
-        except json.JSONDecodeError:
-            log_message("Failed to read settings.json. Creating a new one.", "warning")
-            settings = {}
-
-        # Update 'always_on_top' value
-        settings["always_on_top"] = self.always_on_top
-
-        # Save updated settings
-        try:
-            safe_write_file(SETTINGS_FILE_PATH, json.dumps(settings, indent=2))
-            log_message(
-                f"'Always on Top' set to {ftfy.fix_text(UNICODE_CHR.get('left_arrow', ''))} {str(self.always_on_top)} {ftfy.fix_text(UNICODE_CHR.get('right_arrow', ''))} and saved successfully.",
-                "success",
-            )
-        except Exception as e:
-            log_message(f"Failed to save 'Always on Top' state: {e}", "error")
+        """Schedule the 'Always on Top' state to be saved with the other settings."""
+        self._settings["always_on_top"] = self.always_on_top
+        self.save_settings()
+        log_message(
+            f"'Always on Top' set to {ICONS['left_arrow']} {str(self.always_on_top)} {ICONS['right_arrow']} and will be saved.",
+            "success",
+        )
 
     def closeEvent(self, event):
         """Ensure the window fully closes on the first attempt."""
         self.closing = True
         self.save_settings()
+        self._flush_settings()
 
-        if hasattr(self, "timer"):
-            self.timer.stop()
-        if hasattr(self, "update_check_timer"):
-            self.update_check_timer.stop()
+        if hasattr(self, "_watcher"):
+            self._watcher.blockSignals(True)
+        if hasattr(self, "_rearm_timer"):
+            self._rearm_timer.stop()
 
         self.clear_cache()
 
@@ -597,12 +984,17 @@ class FloatWindow(QMainWindow):
 
     def resizeEvent(self, event):
         """Ensure the indicator stays centered when the window is resized."""
-        self.scaled_image_cache.clear()
         self.label.adjustSize()
-        self.update_image()
+        self.update_image(fast=True)
         self.update_indicator_position()
+        self._resize_timer.start(RESIZE_DEBOUNCE_MS)
+        self.save_settings()
         super().resizeEvent(event)
 
+    def _do_rescale(self):
+        """Smoothly rescale the current image once resizing has settled."""
+        self.update_image()
+
     # --- 🖱️ Dragging Support ---
     def mousePressEvent(self, event):
         """Start dragging when the mouse is pressed."""
@@ -611,9 +1003,11 @@ class FloatWindow(QMainWindow):
             self.offset = event.globalPosition().toPoint() - self.pos()
 
     def mouseMoveEvent(self, event):
-        """Move the window while dragging."""
+        """Move the window while dragging; the new position is saved by the debounced flush."""
         if self.dragging:
-            self.move(event.globalPosition().toPoint() - self.offset)
+            global_pos = event.globalPosition().toPoint()
+            self.move(global_pos - self.offset)
+            self.save_settings()  # Only marks dirty, no I/O during the drag
 
     def mouseReleaseEvent(self, event):
         """Stop dragging when the mouse is released."""
@@ -667,8 +1061,9 @@ class FloatWindow(QMainWindow):
                 log_message("Save operation canceled.", "info")
                 return
 
-            if save_path:
-                QtGui.QPixmap(current_image_path).save(save_path)
+            pixmap = self.load_pixmap(current_image_path)
+            if pixmap is not None:
+                pixmap.save(save_path)
                 log_message(f"Image saved to {save_path}", "success")
 
             return
@@ -677,8 +1072,11 @@ class FloatWindow(QMainWindow):
         """Copy the image to the clipboard."""
         if 0 <= self.current_index < len(self.temp_image_paths):
             current_image_path = self.temp_image_paths[self.current_index]
+            pixmap = self.load_pixmap(current_image_path)
+            if pixmap is None:
+                return
             clipboard = QtWidgets.QApplication.clipboard()
-            clipboard.setPixmap(QtGui.QPixmap(current_image_path))
+            clipboard.setPixmap(pixmap)
             log_message("Image copied to clipboard.", "success")
             return
 
@@ -696,23 +1094,29 @@ def get_qt_app():
     return app
 
 
+# Handle of the float window started by this ComfyUI process, if any
+_float_window_process = None
+
+
 def open_float_window(temp_image_paths):
     """Start or update the Float Preview window as a separate process."""
+    global _float_window_process
 
     # Ensure input is valid
     if not isinstance(temp_image_paths, list):
         log_message("Invalid image paths provided. Expected a list.", "error")
         return
 
-    # Write image paths safely to JSON
+    # Write image paths safely to JSON (compact, machine-read only)
     try:
-        safe_write_file(
-            JSON_FILE_PATH, json.dumps(temp_image_paths, indent=2, ensure_ascii=False)
-        )
+        payload = encode_json(temp_image_paths)
     except Exception as e:
         log_message(f"Failed to write image paths to JSON: {e}", "error")
         return
 
+    if not safe_write_bytes(JSON_FILE_PATH, payload):
+        return
+
     # Check if Float Window is already running
     if is_window_running():
         log_message("Updating existing float window...", "info")
@@ -729,7 +1133,7 @@ def open_float_window(temp_image_paths):
             script_path = get_script_path()
             python_exec = sys.executable
 
-            subprocess.Popen(
+            process = _float_window_process = subprocess.Popen(
                 [python_exec, script_path, "float_window"],
                 stdout=sys.stdout,
                 stderr=sys.stderr,
@@ -737,6 +1141,10 @@ def open_float_window(temp_image_paths):
                 start_new_session=True,
             )
 
+            # Record the child right away, so a quick follow-up call (e.g. the rest
+            # of a batch) updates it instead of starting a second window
+            safe_write_file(PID_FILE_PATH, str(process.pid))
+
         except Exception as e:
             log_message(f"Failed to start float window: {e}", "error")
 
@@ -748,16 +1156,20 @@ def run_float_window():
 
         app = get_qt_app()
 
+        # Publish our PID so is_window_running() can find us without a process scan
+        safe_write_file(PID_FILE_PATH, str(os.getpid()))
+        atexit.register(cleanup_pid_file)
+
         # Ensure JSON file exists
         if not safe_exists(JSON_FILE_PATH):
             log_message("No JSON file found for image paths.", "error")
             return
 
         # Load image paths safely
-        image_paths_data = safe_read_file(JSON_FILE_PATH, default_data="[]")
+        image_paths_data = safe_read_small_file(JSON_FILE_PATH, default_data="[]")
 
         try:
-            temp_image_paths = json.loads(image_paths_data)
+            temp_image_paths = decode_json(image_paths_data)
         except json.JSONDecodeError:
             log_message("Invalid JSON content in float_window_update.json.", "error")
             return
@@ -776,16 +1188,36 @@ def run_float_window():
 
 
 def is_window_running():
-    """Check if the Float Preview process is already running."""
-    script_name = safe_get_name(get_script_path())
-    for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-        try:
-            cmdline = " ".join(proc.info["cmdline"]) if proc.info["cmdline"] else ""
-            if script_name in cmdline or "float_window" in cmdline:
-                return True
-        except (psutil.NoSuchProcess, TypeError):
-            continue
-    return False
+    """Check if the Float Preview process is already running using its PID file."""
+    # Our own child is authoritative; poll() also reaps it once it has exited
+    if _float_window_process is not None:
+        return _float_window_process.poll() is None
+
+    pid_data = safe_read_small_file(PID_FILE_PATH, default_data="")
+    try:
+        pid = int(pid_data.strip())
+    except ValueError:
+        return False
+
+    # A zombie or a recycled PID still "exists", so check the state and command line
+    try:
+        process = psutil.Process(pid)
+        return process.status() != psutil.STATUS_ZOMBIE and (
+            "float_window" in process.cmdline()
+        )
+    except (psutil.Error, OSError):
+        return False
+
+
+def cleanup_pid_file():
+    """Safely delete PID_FILE_PATH on exit using safe_remove(), if it still holds our PID."""
+    # A newer window may have replaced the file; leave its PID alone
+    if safe_read_small_file(PID_FILE_PATH, default_data="").strip() != str(os.getpid()):
+        return
+    try:
+        safe_remove(PID_FILE_PATH)
+    except Exception as e:
+        log_message(f"Failed to delete {PID_FILE_PATH}: {e}", "warning")
 
 
 def cleanup_json_file():
@@ -810,6 +1242,10 @@ class FloatPreviewNode:
                     "BOOLEAN",
                     {"default": False},
                 ),
+                "Preview_Format": (
+                    PREVIEW_FORMATS,
+                    {"default": "PNG"},
+                ),
             },
         }
 
@@ -818,79 +1254,130 @@ class FloatPreviewNode:
     OUTPUT_NODE = True
     CATEGORY = "⚡ Mohseni Kit/Image"
 
-    def execute(self, Image: torch.Tensor, Always_Show_Preview: bool):
+    def execute(
+        self,
+        Image: torch.Tensor,
+        Always_Show_Preview: bool,
+        Preview_Format: str = "PNG",
+    ):
         """Processes the input image tensor and displays it in a floating window."""
         if Image is None:
             log_message("Received None as input image. Skipping execution.", "warning")
             return ()
 
-        try:
-            if safe_is_dir(FLOAT_PREVIEW_TEMP_DIR):
-                for filename in safe_list_dir(FLOAT_PREVIEW_TEMP_DIR):
-                    if filename.startswith("temp_float_preview_"):
-                        file_path = safe_path(FLOAT_PREVIEW_TEMP_DIR, filename)
-                        safe_remove(file_path)
-        except Exception as e:
-            log_message(f"Cleanup failed: {e}", "error")
+        cleanup_preview_images(
+            *filter(None, (FLOAT_PREVIEW_TEMP_DIR, FLOAT_PREVIEW_RAM_DIR))
+        )
 
-        # Check if input is batched (B, H, W, C)
-        if Image.ndim == 4:
-            batch_size = Image.shape[0]
-            images = [Image[i] for i in range(batch_size)]
-        else:
-            images = [Image]
+        # Treat a single image as a batch of one (B, H, W, C)
+        batch = Image if Image.ndim == 4 else Image.unsqueeze(0)
+        if batch.ndim != 4 or batch.shape[3] != 3:
+            raise ValueError(
+                f"Invalid input shape {tuple(batch.shape[1:])}. Expected (H, W, 3) image tensor."
+            )
 
-        # Convert all images to PIL format and save them
-        temp_paths = []
-        num_images = len(images)
+        # Oversized previews are downscaled first; encode cost grows with pixel count
+        batch = downscale_to_max_side(
+            batch.permute(0, 3, 1, 2), PREVIEW_MAX_SIZE
+        ).permute(0, 2, 3, 1)
+
+        batch_u8 = batch_to_uint8_array(batch)
+
+        # Build every temp path up front, then encode the batch on the IO pool
+        num_images = batch_u8.shape[0]
         max_digits = max(len(str(num_images)), 2)
+        format_index = f"{{:0{max_digits}d}}".format  # Zero-padded, built once
 
-        transform = T.ToPILImage()
-        for i, img in enumerate(images):
-            if img.ndim != 3 or img.shape[2] != 3:
-                raise ValueError(
-                    f"Invalid input shape {img.shape}. Expected (H, W, 3) image tensor."
-                )
+        # One random suffix per run; the index already keeps batch files apart
+        run_id = generate_random_string(6)
 
-            img = img.permute(2, 0, 1).clamp(0, 1)
-            pil_img = transform(img)
+        # Encoded previews are at most about the size of the raw frames, so
+        # use RAM only if they fit with headroom; write errors fall back to disk
+        preview_dir = FLOAT_PREVIEW_TEMP_DIR
+        if FLOAT_PREVIEW_RAM_DIR and has_free_space(
+            FLOAT_PREVIEW_RAM_DIR, batch_u8.nbytes + RAM_TEMP_HEADROOM
+        ):
+            preview_dir = FLOAT_PREVIEW_RAM_DIR
 
-            formatted_index = str(i + 1).zfill(max_digits)
+        # The directory and name parts are trusted, so join them once outside the loop
+        path_prefix = os.path.join(preview_dir, "temp_float_preview_")
+        path_suffix = f"_{run_id}{PREVIEW_EXTENSIONS[Preview_Format]}"
 
-            temp_path = safe_path(
-                FLOAT_PREVIEW_TEMP_DIR,
-                f"temp_float_preview_{formatted_index}_{generate_random_string(6)}.png",
-            )
+        # Repeated frames (e.g. held animation frames) are encoded once and
+        # share the first occurrence's path. A strided byte sample filters out
+        # distinct frames cheaply; only sample matches get a full comparison
+        if num_images > 1:
+            sample_step = max(1, batch_u8[0].size // DEDUP_SAMPLE_SIZE)
+            while math.gcd(sample_step, batch_u8.shape[-1]) != 1:
+                sample_step += 1
 
-            pil_img.save(temp_path, format="PNG", optimize=False, compress_level=1)
+        temp_paths = []
+        encode_futures = {}
+        seen_frames = {}
+        for i in range(num_images):
+            frame = batch_u8[i]
+            duplicate_path = None
+            if num_images > 1:
+                sample_key = frame.reshape(-1)[::sample_step].tobytes()
+                candidates = seen_frames.setdefault(sample_key, [])
+                for seen_frame, seen_path in candidates:
+                    if np.array_equal(frame, seen_frame):
+                        duplicate_path = seen_path
+                        break
+            if duplicate_path is not None:
+                temp_paths.append(duplicate_path)
+                continue
+
+            temp_path = f"{path_prefix}{format_index(i + 1)}{path_suffix}"
+            if num_images > 1:
+                candidates.append((frame, temp_path))
+            encode_futures[temp_path] = IO_POOL.submit(
+                save_preview_image_or_fallback, frame, temp_path, Preview_Format
+            )
             temp_paths.append(temp_path)
 
+        # result() waits for an image and re-raises its encoding error, so the
+        # Float Window is only told about written images; it returns the path
+        # actually used, which is on disk after a RAM write failed
+        frame_futures = [encode_futures[temp_path] for temp_path in temp_paths]
+
+        # Show the first frames as soon as they are written, while the rest encode
+        early_count = min(EARLY_PREVIEW_FRAMES, num_images)
+        if early_count < num_images:
+            open_float_window(
+                [future.result() for future in frame_futures[:early_count]]
+            )
+
         # Pass all image paths to the Float Window
-        open_float_window(temp_paths)
+        open_float_window([future.result() for future in frame_futures])
         return ()
 
     @classmethod
-    def IS_CHANGED(cls, Image, Always_Show_Preview=False):
+    def IS_CHANGED(cls, Image, Always_Show_Preview=False, Preview_Format="PNG"):
         """Check if the node should re-execute."""
         if Always_Show_Preview or Image is None:
-            return generate_random_string(12)
+            return f"t{next(_always_tick)}"
 
         try:
-            if Image.ndim == 4:  # (B, H, W, C)
-                Image = Image[0]
-
-            max_size = min(768, max(Image.shape[0], Image.shape[1]) // 4)
-            min_size = 128
-
-            if max(Image.shape[0], Image.shape[1]) > max_size:
-                scale_transform = T.Resize(max_size, antialias=True)
-                Image = scale_transform(Image.permute(2, 0, 1)).permute(1, 2, 0)
-
-            return generate_image_hash(Image)
+            # A strided sample over the whole batch is enough to detect a change.
+            # The stride is kept coprime with the channel count so every channel
+            # is sampled, and the shape is part of the hash
+            flat = Image.reshape(-1)
+            step = max(1, flat.numel() // IS_CHANGED_SAMPLE_SIZE)
+            while math.gcd(step, Image.shape[-1]) != 1:
+                step += 1
+
+            sample_hash = generate_image_hash(flat[::step])
+            image_hash = (
+                f"{tuple(Image.shape)}:{Preview_Format}:{sample_hash}"
+                if sample_hash is not None
+                else None
+            )
+            return image_hash
         except Exception:
             pass
 
-        return generate_random_string(12)
+        return f"t{next(_always_tick)}"
 
 
 if __name__ == "__main__":
@@ -905,3 +1392,9 @@ FP_DISPLAY_NAME_MAPPINGS = {"FloatPreview": "🖼️ Float Preview"}
 
 # --- Cleanup ---
 atexit.register(cleanup_json_file)
+
+# RAM previews would otherwise outlive a ComfyUI restart; the window process
+# (run as __main__) must keep the images it is showing
+if __name__ != "__main__" and FLOAT_PREVIEW_RAM_DIR:
+    cleanup_preview_images(FLOAT_PREVIEW_RAM_DIR)
+    atexit.register(cleanup_preview_images, FLOAT_PREVIEW_RAM_DIR)